@@ -2,28 +2,57 @@ from argparse import ArgumentParser
 import os
 
 from igraph import Graph
-import pandas as pd
 import spacy
 
 from text.text import Book
 from text.processedText import BookDoc
-from text.utils.network import verticesToCsv, edgesToCsv
-from text.utils.emotion import emotionGraphic
+from text.utils.network import verticesToCsv, edgesToCsv, cachedLayout
+from text.utils.gazetteer import gazetteerPipeline
+from text.utils.emotion import emotionGraphic, emotionsToCsv
+from text.utils.lexicon import LexiconRegistry
+from text.utils.evaluation import evaluatePipelines, makeReference, reportToCsv
 
 def main(args):
-	if args.command == 'emotionAnalysis':
-		nlp = spacy.load(args.spacyModel, disable = ["ner"])
-	else:
-		nlp = spacy.load(args.spacyModel)
+	if args.command == 'evaluate':
+		# The book title is the key of both the gold data and the saved character list.
+		goldPath = f'{args.goldPath}/{args.bookTitle}'
+		lexicon = LexiconRegistry(path = './data/lexicon').load(args.lexicon)
+		if args.makeReference:
+			makeReference(goldPath, args.file, args.spacyModel, lexicon)
+		savedCharacters = f'{args.charactersPath}/{args.bookTitle}.txt'
+		characters = None
+		if os.path.isfile(savedCharacters):
+			characters = Book(args.bookTitle).loadCharacters(savedCharacters)._characters
+		report = evaluatePipelines(goldPath, args.file, args.configs, lexicon, characters = characters)
+		reportToCsv(report, path = args.pathSave, fileName = f'{args.bookTitle} - evaluation')
+		print(report.to_string(index = False))
+		return
+
 	path = args.file
 	book = Book(args.bookTitle)
 	book.openBook(path = path).lowercaseBook().sliceBook('#######')
-	bookDoc = BookDoc(book, nlp)
+	gazetteer = args.command == 'network' and args.gazetteer
+	if gazetteer:
+		book.loadCharacters(f'{args.charactersPath}/{book.title}.txt')
+		nlp = gazetteerPipeline(book._characters)
+		bookDoc = BookDoc(book, nlp, delay = 0)
+	else:
+		if args.command == 'emotionAnalysis':
+			nlp = spacy.load(args.spacyModel, disable = ["ner"])
+		else:
+			nlp = spacy.load(args.spacyModel)
+		bookDoc = BookDoc(book, nlp)
 
 	if args.command == 'network':
-		book.characters = bookDoc.extractCharacters()
-
-		links, strength = bookDoc.buildNetwork()
+		if not gazetteer:
+			book.characters = bookDoc.extractCharacters()
+			# Keeps a saved (possibly hand-curated) list unless overwriting is asked.
+			charactersFile = f'{args.charactersPath}/{book.title}.txt'
+			if os.path.isfile(charactersFile) and not args.overwriteCharacters:
+				charactersFile = f'{args.charactersPath}/{book.title}.extracted.txt'
+			book.saveCharacters(charactersFile)
+
+		links, strength = bookDoc.buildNetwork(dist = args.distance, fromEnts = gazetteer)
 		network = Graph(n = len(book.characters), edges = links, directed = False,
 		                vertex_attrs = {'Name':book.characters},
 		                edge_attrs = {'Weight':strength})
@@ -37,20 +66,42 @@ def main(args):
 		communityMembers = mainNetworkCommunities.as_clustering().membership
 		mainNetwork.vs['Community'] = communityMembers
 
-		verticesToCsv(mainNetwork, path = args.pathSave, fileName = f'{book.title} - vertices')
+		layout = args.layout != 'none'
+		if layout:
+			membership = communityMembers if args.layoutSeed else None
+			coords = cachedLayout(mainNetwork, args.layoutCache, algorithm = args.layout,
+			                      membership = membership, iterations = args.layoutIterations,
+			                      timeBudget = args.layoutTime)
+			mainNetwork.vs['X'] = [coord[0] for coord in coords]
+			mainNetwork.vs['Y'] = [coord[1] for coord in coords]
+
+		verticesToCsv(mainNetwork, path = args.pathSave, fileName = f'{book.title} - vertices',
+		              layout = layout)
 		edgesToCsv(mainNetwork, path = args.pathSave, fileName = f'{book.title} - edges')
 		
 	elif args.command == 'emotionAnalysis':
-		lexiconPath = f'./data/lexicon/{args.lexicon}.txt'
-
-		columns = ['Word', 'Emotion', 'Value']
-		lexicon = pd.read_csv(lexiconPath, delim_whitespace = True, header = None, names = columns)
-		y = bookDoc.analysisEmotion(lexicon, emotionPerChapter = args.perChapter)
+		registry = LexiconRegistry(path = './data/lexicon')
+		for lexicon in args.lexicon:
+			name, _, lexiconFormat = lexicon.partition(':')
+			if lexiconFormat:
+				registry.register(name, lexiconFormat)
+		names = [lexicon.partition(':')[0] for lexicon in args.lexicon]
+		lexicons = registry.select(names)
+		# Absent emotions count 0, so each series has one value per chapter.
+		fillEmotion = 0 if args.perChapter else None
+		y = bookDoc.analysisEmotions(lexicons, emotionPerChapter = args.perChapter,
+		                             fillEmotion = fillEmotion)
 
 		maxAxisX = book.chapterTotal
-		emotionGraphic(book.title, args.pathSave, args.showEmotion, y, maxAxisX,
-					   all = args.all, barGraph = args.bar,
-					   extension = args.ext, perChapter = args.perChapter)
+		for name in lexicons:
+			title = book.title if len(lexicons) == 1 else f'{book.title} - {name}'
+			showEmotion = [emotion for emotion in args.showEmotion if emotion in y[name]]
+			if showEmotion:
+				emotionGraphic(title, args.pathSave, showEmotion, y[name], maxAxisX,
+							   all = args.all, barGraph = args.bar,
+							   extension = args.ext, perChapter = args.perChapter)
+			else:
+				emotionsToCsv(title, args.pathSave, y[name], perChapter = args.perChapter)
 
 if __name__ == '__main__':
 	# Main parser
@@ -80,12 +131,33 @@ if __name__ == '__main__':
 	networkParser.add_argument('-ca', '--communityAlg', help = 'The community detection algorithm.',
 							   choices = ["community_walktrap", "community_edge_betweenness"],
 							   default = "community_walktrap")
+	networkParser.add_argument('-cp', '--charactersPath', help = 'Path of the saved character lists (one file per book).',
+							   type = str, default = './data/characters')
+	networkParser.add_argument('-gz', '--gazetteer', help = 'Uses the saved (or hand-curated) character list\
+							   instead of extracting it, processing the book only with the tokenizer.',
+							   action = 'store_true', default = False)
+	networkParser.add_argument('-d', '--distance', help = 'The range (in tokens) to connect two characters.',
+							   type = int, default = 15)
+	networkParser.add_argument('-oc', '--overwriteCharacters', help = 'Overwrites the saved character list with the\
+							   extracted one (otherwise it is recorded in "Title.extracted.txt" when a list exists).',
+							   action = 'store_true', default = False)
+	networkParser.add_argument('-lay', '--layout', help = 'The layout exported with the vertices (X, Y).',
+							   choices = ['drl', 'fr', 'multilevel', 'none'], default = 'drl')
+	networkParser.add_argument('-lse', '--layoutSeed', help = 'Seeds the layout with the detected communities.',
+							   action = 'store_true', default = False)
+	networkParser.add_argument('-li', '--layoutIterations', help = 'The iteration budget of the layout.',
+							   type = int, default = None)
+	networkParser.add_argument('-lt', '--layoutTime', help = 'The time budget of the layout in seconds, seeding included (fr, multilevel).',
+							   type = float, default = None)
+	networkParser.add_argument('-lc', '--layoutCache', help = 'Path of the layouts recorded by graph fingerprint.',
+							   type = str, default = './data/layouts')
 	networkParser.set_defaults(command = "network")
 
 	# Create the parser for the "emotionAnalysis" command
 	emotionParser = subparsers.add_parser('emotionAnalysis', help = 'Calculates the percentage of emotions of the book.')
-	emotionParser.add_argument('-lex', '--lexicon', help = 'The lexicon to do the analysis.',
-							   type = str, default = 'Emolex')
+	emotionParser.add_argument('-lex', '--lexicon', help = 'The lexicons to do the analysis (name or name:format,\
+							   format in binary, intensity, vad), all scored in one pass.',
+							   type = str, default = ['Emolex'], nargs = '+')
 	emotionParser.add_argument('-perChapter', help = 'Emotion Analysis for each chapter.',
 							   action = 'store_true', default = False)
 	emotionParser.add_argument('-bar', help = 'Bar graph.', action = 'store_true',
@@ -104,6 +176,31 @@ if __name__ == '__main__':
 
 	emotionParser.set_defaults(command = "emotionAnalysis")
 
+	# Create the parser for the "evaluate" command
+	evaluateParser = subparsers.add_parser('evaluate', help = 'Compares pipeline configurations against the\
+										   gold data of the book (quality, throughput and peak memory).')
+	evaluateParser.add_argument('-cfg', '--configs', help = 'Pipeline configurations: model, model:disabled,components\
+								or gazetteer.', type = str, nargs = '+',
+								default = ['en_core_web_lg', 'en_core_web_md', 'en_core_web_sm', 'gazetteer'])
+	evaluateParser.add_argument('-gp', '--goldPath', help = 'Path of the gold data (one folder per book title).',
+								type = str, default = './data/evaluation')
+	evaluateParser.add_argument('-mr', '--makeReference', help = 'Generates the reference outputs of the book\
+								with the spaCy model (-sm) and the gold character list before evaluating.',
+								action = 'store_true', default = False)
+	evaluateParser.add_argument('-lex', '--lexicon', help = 'The lexicon of the emotion analysis.',
+								type = str, default = 'Emolex')
+	evaluateParser.add_argument('-cp', '--charactersPath', help = 'Path of the saved character lists used by\
+								the gazetteer configuration (the gold list if absent).',
+								type = str, default = './data/characters')
+	evaluateParser.set_defaults(command = "evaluate")
+
 	# Executes the program with the arguments from command line.
 	args = parser.parse_args()
+	if args.command == 'network' and args.gazetteer\
+	   and not os.path.isfile(f'{args.charactersPath}/{args.bookTitle}.txt'):
+		parser.error(f'no saved character list in {args.charactersPath}/{args.bookTitle}.txt:'
+		             ' run the network command once without -gz to create it.')
+	if args.command == 'network' and args.layout == 'drl' and args.layoutTime is not None:
+		parser.error('-lt/--layoutTime is not supported by the drl layout: use -li/--layoutIterations'
+		             ' or the fr/multilevel layouts.')
 	main(args)
\ No newline at end of file
@@ -25,18 +25,21 @@ class BookDoc:
         _extractInitials(): Extracts initials from a name list based on a regex.
         _extractPseudoProperNoun(): Extracts "pseudo proper nouns" based on the total of occurrences of proper nouns and another classes for the same word.
         buildNetwork(): Make connections between characters based in a range, and calculates the relation weight through the total occurrences of this relationship.
+        _characterOccurrences(): Returns the position and the name of each character occurrence in a chapter.
         _sentenceHasModifiers(): Verify if a word has adverbial modifiers or negation based on its sentence.
         analysisEmotion(lexicon, emotionPerChapter, locEmotion): Analysis the emotions of the book based on a emotion lexicon.
+        analysisEmotions(lexicons, emotionPerChapter, locEmotion): Analysis the emotions of the book based on several emotion lexicons in a single traversal.
+        _scoreEmotion(): Adds the score of a word to an emotion, or to its pair when the word is negated.
     '''
-    def __init__(self, book, nlp, doc = None, cleanDoc = None):
+    def __init__(self, book, nlp, doc = None, cleanDoc = None, delay = 1.5):
         self._book = book
         self._nlp = nlp
         self._doc = []
         for chapter in book._chapters:
         	self._doc.append(nlp(chapter))
         	# Time delay
-        	if len(self._doc) % 2 == 0:
-        		time.sleep(1.5)
+        	if delay and len(self._doc) % 2 == 0:
+        		time.sleep(delay)
         self._cleanDoc = cleanDoc
 
     def clearDoc(self, num = False, punct = False, stop = False, space = False):
@@ -204,7 +207,7 @@ class BookDoc:
 
         return list(set(pseudoProperNoun))
 
-    def buildNetwork(self, dist = 15, idxCharacters = True):
+    def buildNetwork(self, dist = 15, idxCharacters = True, fromEnts = False):
         '''
         Make connections between characters based in a range, and calculates the
         relation weight through the total occurrences of this relationship.
@@ -212,33 +215,50 @@ class BookDoc:
         Parameters:
             dist (int): Range pattern to set relationships.
             idxCharacters (bool): Sets if the connections will be between indexes.
+            fromEnts (bool): Sets if the characters occurrences will be taken from
+                             the PERSON entities (gazetteer pipeline) instead of the tokens.
 
         Returns:
             links (list): The connections between the characters.
             strength (list): The intensity of the connections.
         '''
+        idxNames = {name: idx for idx, name in enumerate(self._book._characters)}
         connections = {}
         for chapter in self._doc:
-            for i in range(len(chapter) - dist):
-                if chapter[i].lower_ in self._book._characters:
-                    for j in range(i + 1, i + dist + 1):
-                        if chapter[j].lower_ in self._book._characters:
-                            if chapter[i].lower_ != chapter[j].lower_:
-                                if idxCharacters:
-                                    par = tuple(sorted(((self._book._characters\
-                                                         .index(chapter[i].lower_),
-                                                         self._book._characters\
-                                                         .index(chapter[j].lower_)))))
-                                else:
-                                    par = tuple(sorted(((chapter[i].lower_, chapter[j].lower_))))   
-                                if par in connections:
-                                    connections[par] += 1
-                                else:
-                                    connections[par] = 1
+            occurrences = self._characterOccurrences(chapter, idxNames, fromEnts)
+            for k, (i, character) in enumerate(occurrences):
+                if i >= len(chapter) - dist:
+                    break
+                for j, other in occurrences[k + 1:]:
+                    if j > i + dist:
+                        break
+                    if character != other:
+                        if idxCharacters:
+                            par = tuple(sorted((idxNames[character], idxNames[other])))
+                        else:
+                            par = tuple(sorted((character, other)))
+                        if par in connections:
+                            connections[par] += 1
+                        else:
+                            connections[par] = 1
         links = list(connections.keys())
         intensity = list(connections.values())
         return links, intensity 
 
+    def _characterOccurrences(self, chapter, idxNames, fromEnts = False):
+        '''
+        Returns the position and the name of each character occurrence in a chapter.
+
+        Parameters:
+            chapter (Doc): The chapter processed.
+            idxNames (dict): The characters names mapped to their indexes.
+            fromEnts (bool): Sets if the occurrences will be taken from the PERSON entities.
+        '''
+        if fromEnts:
+            return [(ent.start, ent.text.lower()) for ent in chapter.ents\
+                    if ent.label_ == 'PERSON' and ent.text.lower() in idxNames]
+        return [(word.i, word.lower_) for word in chapter if word.lower_ in idxNames]
+
     def _sentenceHasModifiers(self, word, advList):
         '''
         Verify if a word has adverbial modifiers or negation based on its
@@ -274,7 +294,7 @@ class BookDoc:
 
     def analysisEmotion(self, lexicon, locEmotion = ['joy', 'trust', 'disgust', 'fear', 'anger',
                                                      'surprise', 'anticipation', 'sadness'],
-                        emotionPerChapter = True):
+                        emotionPerChapter = True, fillEmotion = None):
         '''
         Analysis the emotions of the book based on a emotion lexicon.
 
@@ -282,59 +302,117 @@ class BookDoc:
             lexicon (DataFrame): A lexicon of emotion words - columns pattern: Word, Emotion, Value
             emotionPerChapter (bool): Sets if the analysis will be separated into chapters.
             locEmotion (list): The set of emotions that will be considered in the analysis.
+            fillEmotion (int/float): The value of an emotion absent in a chapter (see analysisEmotions).
         '''
-        lexiconWords = self.filterDataFrame(lexicon, locEmotion, 'Emotion')['Word'].unique()
+        return self.analysisEmotions({'lexicon': lexicon}, locEmotion = locEmotion,
+                                     emotionPerChapter = emotionPerChapter,
+                                     fillEmotion = fillEmotion)['lexicon']
+
+    def analysisEmotions(self, lexicons, locEmotion = None, emotionPerChapter = True,
+                         fillEmotion = None):
+        '''
+        Analysis the emotions of the book based on several emotion lexicons in a
+        single traversal of the tokens: the modifiers of each word are verified once
+        and shared by all lexicons. The value of each (word, emotion) pair is used as
+        its weight, so binary categories count 1 and intensities or signed weights
+        (e.g. valence in [-1, 1]) count their score; only zero values are skipped.
+
+        Parameters:
+            lexicons (dict): The lexicons keyed by name - columns pattern: Word, Emotion, Value
+            emotionPerChapter (bool): Sets if the analysis will be separated into chapters.
+            locEmotion (list): The set of emotions that will be considered in the analysis,
+                               None considers all emotions of each lexicon.
+            fillEmotion (int/float): The value of an emotion absent in a chapter. If None the
+                                     chapter is left out of that emotion series, so the list
+                                     position is not the chapter number.
+
+        Returns:
+            emotions (dict): The analysis of each lexicon keyed by its name.
+        '''
+        affects = {}
+        emotionNames = {}
+        for name, lexicon in lexicons.items():
+            if locEmotion is not None:
+                lexicon = self.filterDataFrame(lexicon, locEmotion, 'Emotion')
+                emotionNames[name] = list(locEmotion)
+            else:
+                emotionNames[name] = list(lexicon['Emotion'].unique())
+            # Every word of the lexicon counts, even with no emotion.
+            affects[name] = {word: [] for word in lexicon['Word'].unique()}
+            for word, emotion, value in lexicon[['Word', 'Emotion', 'Value']].itertuples(index = False):
+                if value != 0:
+                    affects[name][word].append((emotion, value))
 
         if emotionPerChapter:
-            emotions = []
+            emotions = {name: [] for name in lexicons}
         else:
-            wordc = 0
-            avgEmotion = {}    
+            wordc = dict.fromkeys(lexicons, 0)
+            avgEmotion = {name: {} for name in lexicons}
         for count, chapter in enumerate(self._doc):
             if emotionPerChapter:
-                wordc = 0
-                avgEmotion = {}
+                wordc = dict.fromkeys(lexicons, 0)
+                avgEmotion = {name: {} for name in lexicons}
             for word in chapter:
-                if word.text in lexiconWords:
-                    neg, advStrength = self._sentenceHasModifiers(word, advList)
-                    wordc += 1
-                    affect = (lexicon['Word'] == word.text)\
-                                & (lexicon['Value'] > 0)
-                    hasEmotion = lexicon.loc[affect]
-                    options = {"compact": True, "bg": "#09a3d5",
-                               "color": "white", "font": "Source Sans Pro"}
-                    for idx, row in hasEmotion.iterrows():
-                        if row['Emotion'] in locEmotion:
-                            if row['Emotion'] in avgEmotion:
-                                if neg:
-                                    if pairs[row['Emotion']] in avgEmotion:
-                                        avgEmotion[pairs[row['Emotion']]] += 1 * advStrength
-                                else:
-                                    avgEmotion[row['Emotion']] += 1 * advStrength
-                            elif neg:
-                                avgEmotion[pairs[row['Emotion']]] = 1 * advStrength
-                            else:
-                                avgEmotion[row['Emotion']] = 1 * advStrength
+                found = [name for name in lexicons if word.text in affects[name]]
+                if not found:
+                    continue
+                neg, advStrength = self._sentenceHasModifiers(word, advList)
+                for name in found:
+                    wordc[name] += 1
+                    for emotion, value in affects[name][word.text]:
+                        self._scoreEmotion(avgEmotion[name], emotion, value * advStrength, neg)
             if emotionPerChapter:
-                for key in avgEmotion:
-                    avgEmotion[key] = (avgEmotion[key]*100)/wordc
-                emotions.append(avgEmotion)
+                for name in lexicons:
+                    for key in avgEmotion[name]:
+                        avgEmotion[name][key] = (avgEmotion[name][key]*100)/wordc[name]
+                    emotions[name].append(avgEmotion[name])
         if emotionPerChapter:
-            chapterEmotion = {}
-            for emotion in locEmotion:
-                chapterEmotion[emotion] = []
-            for dicionario in emotions:
-                for key in dicionario:
-                    for emotion in chapterEmotion:
-                        if key == emotion:
-                            chapterEmotion[emotion].append(dicionario[key])
-            return chapterEmotion
+            lexiconsEmotion = {}
+            for name in lexicons:
+                chapterEmotion = {}
+                for emotion in emotionNames[name]:
+                    chapterEmotion[emotion] = []
+                for dicionario in emotions[name]:
+                    if fillEmotion is None:
+                        for key in dicionario:
+                            if key in chapterEmotion:
+                                chapterEmotion[key].append(dicionario[key])
+                    else:
+                        for emotion in chapterEmotion:
+                            chapterEmotion[emotion].append(dicionario.get(emotion, fillEmotion))
+                lexiconsEmotion[name] = chapterEmotion
+            return lexiconsEmotion
         else:
-            for key in avgEmotion:
-                avgEmotion[key] = (avgEmotion[key]*100)/wordc
-            emotions = avgEmotion
+            for name in lexicons:
+                for key in avgEmotion[name]:
+                    avgEmotion[name][key] = (avgEmotion[name][key]*100)/wordc[name]
+            return avgEmotion
+
+    def _scoreEmotion(self, avgEmotion, emotion, score, neg):
+        '''
+        Adds the score of a word to an emotion, or to its pair when the word is
+        negated. Emotions without a pair (e.g. the valence, arousal and dominance
+        dimensions) are scored as if the word were not negated: the lexicon formats do
+        not say where the scale is centered, so the weight can not be flipped safely.
 
-            return emotions
+        Parameters:
+            avgEmotion (dict): The accumulated score of each emotion.
+            emotion (str): The emotion of the word.
+            score (int/float): The weight of the word multiplied by the adverb strength.
+            neg (bool): The word have or not negation.
+        '''
+        if emotion not in pairs:
+            neg = False
+        if emotion in avgEmotion:
+            if neg:
+                if pairs[emotion] in avgEmotion:
+                    avgEmotion[pairs[emotion]] += score
+            else:
+                avgEmotion[emotion] += score
+        elif neg:
+            avgEmotion[pairs[emotion]] = score
+        else:
+            avgEmotion[emotion] = score
 
     def _filterSpecialCharac(self, word):
         for letter in word:
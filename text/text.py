@@ -1,3 +1,4 @@
+import os
 import unicodedata
 
 class Book:
@@ -16,6 +17,8 @@ class Book:
         lowercaseBook(): Sets the book content string to a lowercase string.
         removeAccents(): Removes accents from the book content string.
         sliceBook(): Splits the book content into chapters.
+        saveCharacters(): Records the character list in a file.
+        loadCharacters(): Sets the character list from a file.
     '''
     def __init__(self, title, content = None, chapters = None, chapterTotal = None,\
                  characters = None):
@@ -88,4 +91,33 @@ class Book:
         chapters = self._content.split(breaker)
         self.chapterTotal = len(chapters)
         self._chapters = chapters
-        return self
\ No newline at end of file
+        return self
+
+    def saveCharacters(self, path, encoding = 'utf8'):
+        '''
+        Records the character list in a file, one name per line.
+
+        Parameters:
+            path (str): The path of the file.
+            encoding (str): The encoding of the file.
+        '''
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok = True)
+        with open(path, 'w', encoding = encoding) as characters:
+            characters.write('\n'.join(self._characters))
+        return self
+
+    def loadCharacters(self, path, encoding = 'utf8'):
+        '''
+        Sets the character list from a file, one name per line. The file may
+        be hand-curated: blank lines are ignored and names are lowercased.
+
+        Parameters:
+            path (str): The path of the file.
+            encoding (str): The encoding of the file.
+        '''
+        with open(path, 'r', encoding = encoding) as characters:
+            names = [line.strip() for line in characters.readlines()]
+        self.characters = [name for name in names if name]
+        return self
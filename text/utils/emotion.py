@@ -4,6 +4,7 @@ import warnings
 import matplotlib as mpl
 import matplotlib.pyplot as plt
 import matplotlib.ticker as tk
+import pandas as pd
 
 adverbs = {
            'Increase': ('absolutely', 'completely', 'incredibly', 'deeply',
@@ -114,4 +115,25 @@ def emotionGraphic(title, path, emotions, y, x = 0, fonts = {"supTitle": "Times
             else:
                 axe.bar(x = emotion.capitalize(), height = y[emotion], align = 'center',
                         color = f'{colors[emotion]}90', width = 0.5)
-    fig.savefig(file, bbox_inches = "tight", pad_inches = 3, dpi = 400)
\ No newline at end of file
+    fig.savefig(file, bbox_inches = "tight", pad_inches = 3, dpi = 400)
+
+def emotionsToCsv(title, path, y, perChapter = False, index = True):
+    '''
+    Generates a comma separated value file (.csv) with the emotions of a dictionary.
+    Per chapter, each series must have one value per chapter (see fillEmotion in analysisEmotions).
+    '''
+    file = f'{path}/Emotions - {title}.csv'
+
+    if os.path.isfile(file):
+        n = 0
+        while os.path.isfile(file):
+            n += 1
+            file = f'{path}/Emotions - {title} ({n}).csv'
+
+    if perChapter:
+        chapterTotal = max((len(values) for values in y.values()), default = 0)
+        table = pd.DataFrame(y, index = range(1, chapterTotal + 1))
+        table.to_csv(file, index = index, index_label = 'Chapter')
+    else:
+        table = pd.DataFrame({'Emotion': list(y.keys()), 'Value': list(y.values())})
+        table.to_csv(file, index = False)
@@ -0,0 +1,234 @@
+import multiprocessing
+import os
+import time
+
+import numpy as np
+import pandas as pd
+import spacy
+
+from text.text import Book
+from text.processedText import BookDoc
+from text.utils.gazetteer import gazetteerPipeline
+
+try:
+    import resource
+except ImportError:
+    # Not available on Windows: the peak memory is not reported.
+    resource = None
+
+def parseConfig(config):
+    '''
+    Splits a pipeline configuration - pattern: model or model:component,component
+    (the components after ":" are disabled). "gazetteer" is the tokenizer-only pipeline.
+
+    Returns:
+        model (str): The spacy model (or "gazetteer").
+        disable (list): The components disabled.
+    '''
+    model, _, components = config.partition(':')
+    disable = [component for component in components.split(',') if component]
+    return model, disable
+
+def runConfig(config, bookPath, lexicon, characters = None, breaker = '#######'):
+    '''
+    Runs extractCharacters, buildNetwork and analysisEmotion under a pipeline
+    configuration, measuring the time of each stage and the peak memory.
+
+    Parameters:
+        config (str): The pipeline configuration (see parseConfig).
+        bookPath (str): The book .txt path.
+        lexicon (DataFrame): The emotion lexicon - columns pattern: Word, Emotion, Value
+        characters (list): A known character list; when given the extraction is skipped.
+        breaker (str): The delimiter for the chapters.
+
+    Returns:
+        result (dict): The outputs and measures of the run.
+    '''
+    model, disable = parseConfig(config)
+    gazetteer = model == 'gazetteer'
+    result = {'Config': config}
+
+    start = time.perf_counter()
+    if gazetteer:
+        nlp = gazetteerPipeline(characters)
+    else:
+        nlp = spacy.load(model, disable = disable)
+    result['Load (s)'] = time.perf_counter() - start
+
+    book = Book(config)
+    book.openBook(path = bookPath).lowercaseBook().sliceBook(breaker)
+    start = time.perf_counter()
+    bookDoc = BookDoc(book, nlp, delay = 0)
+    result['Process (s)'] = time.perf_counter() - start
+    tokens = sum(len(chapter) for chapter in bookDoc._doc)
+    result['Tokens/s'] = tokens / result['Process (s)']
+
+    start = time.perf_counter()
+    book.characters = characters if characters is not None else bookDoc.extractCharacters()
+    result['Characters (s)'] = time.perf_counter() - start
+    result['characters'] = list(book._characters)
+
+    start = time.perf_counter()
+    links, strength = bookDoc.buildNetwork(idxCharacters = False, fromEnts = gazetteer)
+    result['Network (s)'] = time.perf_counter() - start
+    result['edges'] = dict(zip(links, strength))
+
+    result['emotions'] = None
+    if not gazetteer:
+        start = time.perf_counter()
+        try:
+            series = bookDoc.analysisEmotion(lexicon, emotionPerChapter = True, fillEmotion = 0)
+            # Keys each value by its chapter number (the chapters are counted from 1).
+            result['emotions'] = {emotion: {chapter: value for chapter, value in enumerate(values, start = 1)}
+                                  for emotion, values in series.items()}
+        except ValueError:
+            # The pipeline has no sentence boundaries (e.g. parser disabled).
+            pass
+        result['Emotion (s)'] = time.perf_counter() - start
+
+    if resource is not None:
+        # ru_maxrss is in kilobytes on Linux.
+        result['Peak memory (MB)'] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    return result
+
+def runIsolated(*args, **kwargs):
+    '''Executes runConfig in a new process, so the peak memory is measured per configuration.'''
+    context = multiprocessing.get_context('spawn')
+    with context.Pool(processes = 1) as pool:
+        return pool.apply(runConfig, args, kwargs)
+
+def characterScores(characters, gold):
+    '''Returns the precision, recall and F1 of a character list against the gold list.'''
+    characters, gold = set(characters), set(gold)
+    hits = len(characters & gold)
+    precision = hits / len(characters) if characters else 0.0
+    recall = hits / len(gold) if gold else 0.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+    return precision, recall, f1
+
+def edgeCorrelation(edges, reference):
+    '''
+    Returns the Pearson correlation between the edge weights of two networks,
+    over the union of their edges (an absent edge weighs 0).
+    '''
+    pairs = sorted(set(edges) | set(reference))
+    if len(pairs) < 2:
+        return np.nan
+    weights = np.array([edges.get(pair, 0) for pair in pairs], dtype = float)
+    referenceWeights = np.array([reference.get(pair, 0) for pair in pairs], dtype = float)
+    if weights.std() == 0 or referenceWeights.std() == 0:
+        return np.nan
+    return np.corrcoef(weights, referenceWeights)[0, 1]
+
+def emotionError(emotions, reference):
+    '''
+    Returns the mean absolute error between two emotion series keyed by chapter,
+    over the emotions and chapters of both (a missing chapter counts 0).
+    '''
+    if emotions is None:
+        return np.nan
+    errors = []
+    for emotion, series in reference.items():
+        other = emotions.get(emotion, {})
+        for chapter in sorted(set(series) | set(other)):
+            errors.append(abs(series.get(chapter, 0) - other.get(chapter, 0)))
+    return float(np.mean(errors)) if errors else np.nan
+
+def loadGold(goldPath):
+    '''
+    Reads the gold data of a book: characters.txt (hand-curated, one name per line),
+    edges.csv (Source, Target, Weight) and emotions.csv (one column per emotion, one row per chapter).
+    The reference files are None while they have not been generated.
+    '''
+    with open(f'{goldPath}/characters.txt', 'r', encoding = 'utf8') as file:
+        characters = sorted(set(line.strip().lower() for line in file.readlines() if line.strip()))
+    edges = None
+    if os.path.isfile(f'{goldPath}/edges.csv'):
+        table = pd.read_csv(f'{goldPath}/edges.csv')
+        edges = {tuple(sorted((row.Source, row.Target))): row.Weight for row in table.itertuples()}
+    emotions = None
+    if os.path.isfile(f'{goldPath}/emotions.csv'):
+        table = pd.read_csv(f'{goldPath}/emotions.csv', index_col = 'Chapter')
+        emotions = {emotion: table[emotion].fillna(0).to_dict() for emotion in table.columns}
+    return characters, edges, emotions
+
+def makeReference(goldPath, bookPath, config, lexicon):
+    '''
+    Generates the reference outputs of a book (edges.csv and emotions.csv) from the
+    reference pipeline configuration and the gold character list.
+    '''
+    characters, _, _ = loadGold(goldPath)
+    result = runIsolated(config, bookPath, lexicon, characters = characters)
+    edges = pd.DataFrame([(source, target, weight) for (source, target), weight in result['edges'].items()],
+                         columns = ['Source', 'Target', 'Weight'])
+    edges.to_csv(f'{goldPath}/edges.csv', index = False)
+    emotions = pd.DataFrame(result['emotions']).sort_index().fillna(0)
+    emotions.to_csv(f'{goldPath}/emotions.csv', index_label = 'Chapter')
+
+def evaluatePipelines(goldPath, bookPath, configs, lexicon, characters = None):
+    '''
+    Runs each pipeline configuration in its own process and compares its outputs
+    against the gold data of the book.
+
+    Parameters:
+        goldPath (str): The folder with the gold data of the book.
+        bookPath (str): The book .txt path.
+        configs (list): The pipeline configurations (see parseConfig).
+        lexicon (DataFrame): The emotion lexicon - columns pattern: Word, Emotion, Value
+        characters (list): The character list of the gazetteer configuration,
+                           the gold list if None.
+
+    Returns:
+        report (DataFrame): The quality and the speed/memory measures of each configuration.
+                            The character scores are NaN for configurations that do not
+                            extract the characters, and so is the edge correlation when the
+                            gold list itself was given (both would be scored against themselves).
+                            A configuration that fails (e.g. a model not installed) gets
+                            NaN measures and its error in the Error column.
+    '''
+    goldCharacters, goldEdges, goldEmotions = loadGold(goldPath)
+    rows = []
+    for config in configs:
+        try:
+            if parseConfig(config)[0] == 'gazetteer':
+                source = 'saved' if characters is not None else 'gold'
+                result = runIsolated(config, bookPath, lexicon,
+                                     characters = characters if characters is not None else goldCharacters)
+            else:
+                source = 'extracted'
+                result = runIsolated(config, bookPath, lexicon)
+        except Exception as error:
+            # Reports the other configurations even if this one can not run.
+            rows.append({'Config': config, 'Character list': source, 'Precision': np.nan,
+                         'Recall': np.nan, 'F1': np.nan, 'Edge correlation': np.nan,
+                         'Emotion MAE': np.nan, 'Error': f'{type(error).__name__}: {error}'})
+            continue
+        result['Character list'] = source
+        if source == 'extracted':
+            precision, recall, f1 = characterScores(result.pop('characters'), goldCharacters)
+        else:
+            result.pop('characters')
+            precision, recall, f1 = np.nan, np.nan, np.nan
+        edges = result.pop('edges')
+        emotions = result.pop('emotions')
+        result['Precision'] = precision
+        result['Recall'] = recall
+        result['F1'] = f1
+        if goldEdges is not None and source != 'gold':
+            result['Edge correlation'] = edgeCorrelation(edges, goldEdges)
+        else:
+            result['Edge correlation'] = np.nan
+        result['Emotion MAE'] = emotionError(emotions, goldEmotions) if goldEmotions is not None else np.nan
+        result['Error'] = None
+        rows.append(result)
+    return pd.DataFrame(rows)
+
+def reportToCsv(report, path, fileName):
+    '''Generates a comma separated value file (.csv) with the evaluation report.'''
+    local = f'{str(path)}/{str(fileName)}.csv'
+    if os.path.isfile(local):
+        x = 0
+        while os.path.isfile(local):
+            x += 1
+            local = f'{str(path)}/{str(fileName)}({x}).csv'
+    report.to_csv(local, index = False)
@@ -0,0 +1,21 @@
+import spacy
+from spacy.pipeline import EntityRuler
+
+def gazetteerPipeline(characters, lang = 'en', label = 'PERSON'):
+	'''
+	Builds a tokenizer-only spacy pipeline that marks the known characters as
+	entities, skipping the statistical components (tagger, parser and ner).
+
+	Parameters:
+		characters (list): The character names of the book.
+		lang (str): The language of the tokenizer.
+		label (str): The entity label given to the characters.
+
+	Returns:
+		nlp (Language): The spacy object with an EntityRuler built from the characters.
+	'''
+	nlp = spacy.blank(lang)
+	ruler = EntityRuler(nlp, phrase_matcher_attr = 'LOWER')
+	ruler.add_patterns([{'label': label, 'pattern': character} for character in characters])
+	nlp.add_pipe(ruler)
+	return nlp
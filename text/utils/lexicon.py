@@ -0,0 +1,113 @@
+import pandas as pd
+
+columns = ['Word', 'Emotion', 'Value']
+
+def readBinaryLexicon(path):
+    '''
+    Reads a lexicon of binary categories (e.g. Emolex) - lines pattern: word emotion 0/1.
+
+    Parameters:
+        path (str): The path of the lexicon file.
+
+    Returns:
+        lexicon (DataFrame): The lexicon - columns pattern: Word, Emotion, Value
+    '''
+    return pd.read_csv(path, delim_whitespace = True, header = None, names = columns)
+
+def readIntensityLexicon(path):
+    '''
+    Reads a lexicon of real-valued intensities (e.g. NRC Emotion Intensity) - lines
+    pattern: word emotion score. A header line, if present, is dropped.
+
+    Parameters:
+        path (str): The path of the lexicon file.
+
+    Returns:
+        lexicon (DataFrame): The lexicon - columns pattern: Word, Emotion, Value
+    '''
+    lexicon = pd.read_csv(path, delim_whitespace = True, header = None, names = columns)
+    lexicon['Value'] = pd.to_numeric(lexicon['Value'], errors = 'coerce')
+    return lexicon.dropna(subset = ['Value']).reset_index(drop = True)
+
+def readVadLexicon(path):
+    '''
+    Reads a lexicon of weights per dimension (e.g. NRC Valence-Arousal-Dominance) -
+    a header line with the word column followed by one column per dimension.
+    Missing or non-numeric values are dropped.
+
+    Parameters:
+        path (str): The path of the lexicon file.
+
+    Returns:
+        lexicon (DataFrame): The lexicon - columns pattern: Word, Emotion, Value
+    '''
+    wide = pd.read_csv(path, sep = '\t', header = 0)
+    wide = wide.rename(columns = {wide.columns[0]: 'Word'})
+    lexicon = wide.melt(id_vars = 'Word', var_name = 'Emotion', value_name = 'Value')
+    lexicon['Emotion'] = lexicon['Emotion'].str.lower()
+    lexicon['Value'] = pd.to_numeric(lexicon['Value'], errors = 'coerce')
+    lexicon = lexicon.dropna(subset = ['Value'])
+    # Keeps the order of the words, as in the other formats.
+    return lexicon.sort_values('Word', kind = 'mergesort').reset_index(drop = True)
+
+adapters = {'binary': readBinaryLexicon, 'intensity': readIntensityLexicon,
+            'vad': readVadLexicon}
+
+class LexiconRegistry:
+    '''
+    A class that loads emotion lexicons lazily, each one with its own format adapter.
+
+    Attributes:
+        path (str): The folder of the lexicon files ({path}/{name}.txt).
+        _formats (dict): The format of each registered lexicon.
+        _lexicons (dict): The lexicons already loaded.
+
+    Methods:
+        register(name, lexiconFormat): Registers a lexicon and its format.
+        load(name): Returns a lexicon, reading it on the first call.
+        select(names): Returns the lexicons keyed by name.
+    '''
+    def __init__(self, path = './data/lexicon', formats = {'Emolex': 'binary'}):
+        self.path = path
+        self._formats = dict(formats)
+        self._lexicons = {}
+
+    def register(self, name, lexiconFormat = 'binary'):
+        '''
+        Registers a lexicon and its format.
+
+        Parameters:
+            name (str): The lexicon name (the file name without .txt).
+            lexiconFormat (str): The format adapter - binary, intensity or vad.
+        '''
+        if lexiconFormat not in adapters:
+            raise ValueError(f'Unknown lexicon format: {lexiconFormat}. Options: {list(adapters)}')
+        if self._formats.get(name) != lexiconFormat:
+            self._lexicons.pop(name, None)
+        self._formats[name] = lexiconFormat
+        return self
+
+    def load(self, name):
+        '''
+        Returns a lexicon, reading it on the first call. Lexicons not registered
+        are read as binary categories.
+
+        Parameters:
+            name (str): The lexicon name.
+
+        Returns:
+            lexicon (DataFrame): The lexicon - columns pattern: Word, Emotion, Value
+        '''
+        if name not in self._lexicons:
+            lexiconFormat = self._formats.get(name, 'binary')
+            self._lexicons[name] = adapters[lexiconFormat](f'{self.path}/{name}.txt')
+        return self._lexicons[name]
+
+    def select(self, names):
+        '''
+        Returns the lexicons keyed by name.
+
+        Parameters:
+            names (list): The lexicons names.
+        '''
+        return {name: self.load(name) for name in names}
@@ -1,5 +1,10 @@
-import pandas as pd
+import hashlib
+import math
 import os
+import random
+import time
+
+import pandas as pd
 
 def edgesToCsv(graph, path, fileName, index = False, thickness = True,\
                undirected = True):
@@ -37,7 +42,7 @@ def edgesToCsv(graph, path, fileName, index = False, thickness = True,\
 	tableEdge.to_csv(local, index = index, index_label = 'Id')
 
 def verticesToCsv(graph, path, fileName, index = True,
-                  size = True, community = True):
+                  size = True, community = True, layout = False):
 	'''
 	Generates a comma separated value file (.csv) with vertices and their attributes from a Graph object.
 
@@ -48,6 +53,7 @@ def verticesToCsv(graph, path, fileName, index = True,
 		index (bool): Sets if the .csv will have an index.
 		size (bool): Sets if the .csv will have a column for vertices' size.
 		community (bool): Sets if the .csv file will have a column for vertices' community.
+		layout (bool): Sets if the .csv file will have columns for vertices' coordinates (X, Y).
 	'''
 	local = f'{str(path)}/{str(fileName)}.csv'
 	if os.path.isfile(local):
@@ -67,4 +73,107 @@ def verticesToCsv(graph, path, fileName, index = True,
 		members = [None]*graph.vcount()
 	table_vertice = pd.DataFrame({'Label': graph.vs['Name'],
 	                              'Size': size, 'Community': members})
-	table_vertice.to_csv(local, index = index, index_label = 'Id')
\ No newline at end of file
+	if layout:
+		table_vertice['X'] = graph.vs['X']
+		table_vertice['Y'] = graph.vs['Y']
+	table_vertice.to_csv(local, index = index, index_label = 'Id')
+
+def graphFingerprint(graph):
+	'''Returns a hash that identifies the vertices, edges and weights of a Graph object.'''
+	content = repr((graph.vs['Name'], graph.get_edgelist(), graph.es['Weight']))
+	return hashlib.sha1(content.encode('utf8')).hexdigest()
+
+def communitySeed(graph, membership, jitter = 1.0):
+	'''
+	Returns initial coordinates with each vertex near its community, the communities
+	placed by the layout of the graph contracted by community.
+
+	Parameters:
+		graph (Graph): The object which represents a graph.
+		membership (list): The community of each vertex.
+		jitter (float): The maximum displacement of a vertex from its community position.
+	'''
+	quotient = graph.copy()
+	quotient.contract_vertices(membership)
+	quotient.simplify(combine_edges = {'Weight': 'sum'})
+	weights = 'Weight' if quotient.ecount() else None
+	coarse = quotient.layout_fruchterman_reingold(weights = weights).coords
+	scale = math.sqrt(graph.vcount())
+	generator = random.Random(0)
+	return [[coarse[member][0] * scale + generator.uniform(-jitter, jitter),
+	         coarse[member][1] * scale + generator.uniform(-jitter, jitter)] for member in membership]
+
+def computeLayout(graph, algorithm = 'drl', membership = None, iterations = None,
+                  timeBudget = None, probe = 20):
+	'''
+	Computes the coordinates of the vertices of a Graph object with a force-directed layout.
+
+	Parameters:
+		graph (Graph): The object which represents a graph.
+		algorithm (str): The layout - drl, fr (Fruchterman-Reingold) or multilevel
+		                 (fr refining the layout of the multilevel communities).
+		membership (list): The community of each vertex to seed the layout, if any.
+		iterations (int): The iteration budget (default of each algorithm if None).
+		timeBudget (float): The time budget in seconds (fr and multilevel), counted from the
+		                    start, so it includes the community detection and the seeding. A short
+		                    probe run estimates the time of an iteration, then the iterations that fit
+		                    in the rest of the budget (at most the iteration budget) run in a single
+		                    call, so the layout cools down once, as in an unbounded run. DrL can not
+		                    be bounded by time: a ValueError is raised.
+		probe (int): The iterations of the probe run.
+
+	Returns:
+		coords (list): The [x, y] coordinates of each vertex.
+	'''
+	if algorithm == 'drl' and timeBudget is not None:
+		raise ValueError('The drl layout does not support a time budget, use an iteration budget.')
+	start = time.perf_counter()
+	weights = graph.es['Weight']
+	if algorithm == 'multilevel' and membership is None:
+		membership = graph.community_multilevel(weights = weights).membership
+	seed = communitySeed(graph, membership) if membership is not None else None
+
+	if algorithm == 'drl':
+		options = None
+		if iterations is not None:
+			# Splits the budget between the DrL stages in their default proportions.
+			stages = {'init_iterations': 0, 'liquid_iterations': 200, 'expansion_iterations': 200,
+			          'cooldown_iterations': 200, 'crunch_iterations': 50, 'simmer_iterations': 100}
+			total = sum(stages.values())
+			options = {stage: int(value * iterations / total) for stage, value in stages.items()}
+		return graph.layout_drl(weights = weights, seed = seed, options = options).coords
+
+	if iterations is None:
+		iterations = 150 if algorithm == 'multilevel' else 500
+	if timeBudget is not None and iterations > probe:
+		probeStart = time.perf_counter()
+		probeLayout = graph.layout_fruchterman_reingold(weights = weights, niter = probe, seed = seed)
+		elapsed = time.perf_counter() - probeStart
+		remaining = timeBudget - (time.perf_counter() - start)
+		fit = int(remaining * probe / elapsed) if elapsed > 0 else iterations
+		if fit < probe:
+			# Not enough time left for a longer run than the probe.
+			return probeLayout.coords
+		iterations = min(iterations, fit)
+	return graph.layout_fruchterman_reingold(weights = weights, niter = iterations, seed = seed).coords
+
+def cachedLayout(graph, path, algorithm = 'drl', membership = None, iterations = None,
+                 timeBudget = None):
+	'''
+	Returns the layout of a Graph object (see computeLayout), reusing the one recorded
+	in path for the same graph fingerprint and parameters.
+
+	Parameters:
+		graph (Graph): The object which represents a graph.
+		path (str): The local where the layouts are recorded.
+	'''
+	key = repr((graphFingerprint(graph), algorithm, membership, iterations, timeBudget))
+	local = f'{str(path)}/{hashlib.sha1(key.encode("utf8")).hexdigest()}.csv'
+	if os.path.isfile(local):
+		return pd.read_csv(local)[['X', 'Y']].values.tolist()
+
+	coords = computeLayout(graph, algorithm = algorithm, membership = membership,
+	                       iterations = iterations, timeBudget = timeBudget)
+	os.makedirs(path, exist_ok = True)
+	pd.DataFrame(coords, columns = ['X', 'Y']).to_csv(local, index = False)
+	return coords